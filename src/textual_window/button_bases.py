@@ -20,6 +20,9 @@ class ButtonStatic(NoSelectStatic):
     """This class is used in window.py, windowbar.py, and switcher.py to create buttons."""
 
     class Pressed(Message):
+
+        __slots__ = ("button",)
+
         def __init__(self, button: ButtonStatic) -> None:
             super().__init__()
             self.button = button
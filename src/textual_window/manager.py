@@ -58,6 +58,7 @@ class WindowManager:
         self._windowbar: WindowBar | None = None
         self._last_focused_window: Window | None = None
         self._recent_focus_order: list[Window] = []
+        self._snapped_windows: set[Window] = set()  # Kept in sync by Window.watch_snap_state()
         self._mounting_callbacks: dict[str, Callable[[Window], Awaitable[None]]] = {}
 
         # These 3 variables are just used to keep track of the closing process.
@@ -102,6 +103,12 @@ class WindowManager:
         # called by Window.compose()
         return self._recent_focus_order
 
+    @property
+    def snapped_windows(self) -> set[Window]:
+        """Get the set of registered windows that are currently snapped / locked."""
+        # called by WindowBar._clamp_snapped_windows()
+        return self._snapped_windows
+
     @property
     def mounting_callbacks(self) -> dict[str, Callable[[Window], Awaitable[None]]]:
         """Get the dictionary of mounting callbacks."""
@@ -210,6 +217,18 @@ class WindowManager:
         if self._windowbar:
             self._windowbar.update_window_button_state(window, state)
 
+    def signal_snap_state(self, window: Window, state: bool) -> None:
+        """Keeps the `snapped_windows` set up to date when a window is snapped
+        or unsnapped, so the WindowBar doesn't need to check every window."""
+        # called by Window.watch_snap_state()
+
+        if window.id not in self._windows:  # Not registered yet (or anymore).
+            return
+        if state:
+            self._snapped_windows.add(window)
+        else:
+            self._snapped_windows.discard(window)
+
     ######################
     # ~ Window Methods ~ #
     ######################
@@ -218,8 +237,7 @@ class WindowManager:
         # called by Window._dom_ready()
 
         if self._windowbar:
-            button_worker = self._windowbar.add_window_button(window)  # type: ignore[unused-ignore]
-            await button_worker.wait()
+            self._windowbar.add_window_button(window)
             return True
         else:
             return None
@@ -228,16 +246,28 @@ class WindowManager:
         """Used by windows to register with the manager.
         Windows do this automatically when they are mounted. There should not be any
         need to call this method manually."""
-        # called by Window.__init__()
+        # called by Window._on_mount()
 
-        if window.id:
-            self._windows[window.id] = window
-        else:
+        if not window.id:
             raise ValueError(
                 "Window ID is not set. "
                 "Please set the ID of the window before registering it with the manager."
             )
-        self._recent_focus_order.append(window)
+
+        # Children mount before their parents, so mount order isn't construction order.
+        # Windows are kept sorted by layer_index, which is assigned in Window.__init__().
+        self._windows[window.id] = window
+        if any(other.layer_index > window.layer_index for other in self._windows.values()):
+            ordered = sorted(self._windows.items(), key=lambda item: item[1].layer_index)
+            self._windows.clear()  # Re-sort in place, callers may hold the `windows` dict.
+            self._windows.update(ordered)
+
+        index = len(self._recent_focus_order)
+        while index > 0 and self._recent_focus_order[index - 1].layer_index > window.layer_index:
+            index -= 1
+        self._recent_focus_order.insert(index, window)
+        if window.snap_state:
+            self._snapped_windows.add(window)
 
     def unregister_window(self, window: Window) -> None:
         """Used by windows to unregister with the manager.
@@ -254,6 +284,7 @@ class WindowManager:
                 "Please make sure the window is registered with the manager before unregistering it."
             )
         self._recent_focus_order.remove(window)
+        self._snapped_windows.discard(window)
 
         if self._windowbar:
             self._windowbar.remove_window_button(window)
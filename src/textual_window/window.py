@@ -9,7 +9,7 @@ You don't need to import from this module. You can simply do:
 
 # Python imports
 from __future__ import annotations
-from typing import Literal, Any, TYPE_CHECKING, Callable, Optional, Iterable, TypedDict
+from typing import Literal, Any, TYPE_CHECKING, Callable, Optional, Iterable, TypedDict, cast
 from textual.await_remove import AwaitRemove
 
 if TYPE_CHECKING:
@@ -33,7 +33,7 @@ from textual.reactive import reactive
 
 # Local imports
 from textual_window.manager import window_manager
-from textual_window.windowcomponents import Resizer, TopBar, BottomBar
+from textual_window.windowcomponents import TopBar, BottomBar
 
 __all__ = [
     "Window",
@@ -48,6 +48,26 @@ STARTING_VERTICAL = Literal["top", "uppermiddle", "middle", "lowermiddle", "bott
 STARTING_HORIZONTAL = Literal["left", "centerleft", "center", "centerright", "right"]
 MODE = Literal["permanent", "temporary"]
 
+# Given how far the window can move before hitting the edge of the parent,
+# these return the starting coordinate for each starting position.
+_STARTING_HORIZONTALS: dict[str, Callable[[int], int]] = {  # Example: x = 20
+    "left": lambda x: 0,  #                       0              = 0
+    "centerleft": lambda x: x // 4,  #            20 / 4         = 5
+    "center": lambda x: x // 2,  #                20 / 2         = 10
+    "centerright": lambda x: x - (x // 4),  #     20 - (20 / 4)  = 15
+    "right": lambda x: x,  #                      20             = 20
+}
+_STARTING_VERTICALS: dict[str, Callable[[int], int]] = {
+    "top": lambda y: 0,
+    "uppermiddle": lambda y: y // 4,
+    "middle": lambda y: y // 2,
+    "lowermiddle": lambda y: y - (y // 4),
+    "bottom": lambda y: y,
+}
+
+# The keys of WindowStylesDict, in the order they are applied in `_calculate_all_sizes`.
+_WINDOW_STYLE_KEYS = ("min_width", "min_height", "max_width", "max_height", "width", "height")
+
 
 class WindowStylesDict(TypedDict, total=False):
     """A dictionary of styles for the Window widget.
@@ -70,6 +90,8 @@ class WindowStylesDict(TypedDict, total=False):
 class WindowMessage(Message):
     """Generic base class for window messages."""
 
+    __slots__ = ("window",)
+
     def __init__(self, window: Window) -> None:
         super().__init__()
         self.window = window
@@ -85,8 +107,8 @@ class Window(Widget):
     Window {
         width: 25; height: 12;
         min-width: 12; min-height: 6;
-        &:focus { 
-            & > TopBar, BottomBar { background: $secondary; }
+        &:focus, &.descendant-focused { 
+            & > TopBar, & > BottomBar { background: $secondary; }
             & > #content_pane { 
                 border-left: wide $secondary;
                 border-right: wide $secondary;
@@ -96,7 +118,6 @@ class Window(Widget):
     TopBar, BottomBar {
         width: 1fr; height: 1; max-height: 1;
         background: $panel-lighten-1; 
-        &.focused { background: $secondary; }     
     }   
     TitleBar {
         width: 1fr; height: 1; padding: 0 1; 
@@ -125,10 +146,6 @@ class Window(Widget):
         border-bottom: none;
         padding: 1 0 1 1; 
         align: center top;
-        &.focused {
-            border-left: wide $secondary;
-            border-right: wide $secondary;
-        }        
     }    
     """
 
@@ -175,15 +192,23 @@ class Window(Widget):
     class Closed(WindowMessage):
         """Message sent when the window is closed."""
 
+        __slots__ = ()
+
     class Opened(WindowMessage):
         """Message sent when the window is opened."""
 
+        __slots__ = ()
+
     class Minimized(WindowMessage):
         """Message sent when the window is minimized."""
 
+        __slots__ = ()
+
     class Initialized(WindowMessage):
         """Message sent when the window is completed initialization."""
 
+        __slots__ = ()
+
     def __init__(
         self,
         *children: Widget,
@@ -279,6 +304,7 @@ class Window(Widget):
         self.animated = animated
         self.show_title = show_title
         self.icon = icon
+        self.display_name = f"{icon} {name_to_use}" if icon else name_to_use  # Used by the WindowBar.
 
         # SECONDARY ATTRIBUTES (non-constructor)
         self.auto_bring_forward = True  #       If windows should be brought forward when opened.
@@ -296,53 +322,63 @@ class Window(Widget):
         self.max_height: int | None = None  # The maximum height of the window.
         self.min_width: int
         self.min_height: int
+        self._start_pos_cache: tuple[tuple[Size, int, int, str, str], Offset] | None = None
 
         # -------------------------------------------------------------------------#
 
         self.layer_index = Window._current_layer
         Window._current_layer += 1  # increment the class variable for the next window's layer
+        self._layer_name = f"window{self.layer_index}"
 
         # Below are the three widgets that make up the window.
         # The top bar, the content pane, and the bottom bar.
         # All three of these are mounted to the window in the overridden _compose method.
         # When someone uses the window, any children they pass in will be mounted
         # into the content pane. The top and bottom bars are fixed.
+        # The content pane must exist right away because compose_add_child puts children
+        # into it before the window is composed. The top and bottom bars are not needed
+        # until then, so they are only built in _compose.
 
-        window_title = name_to_use if show_title else ""
+        self._window_title = name_to_use if show_title else ""
 
-        self._top_bar = TopBar(window=self, window_title=window_title, options=self.menu_options)
+        self._top_bar: TopBar
         self._content_pane = VerticalScroll(id="content_pane", can_focus=False)
-        self._bottom_bar = BottomBar(window=self)
+        self._bottom_bar: BottomBar
 
-        self._window_base_widgets: list[Widget] = [
-            self._top_bar,
-            self._content_pane,
-            self._bottom_bar,
-        ]
+        # The window registers itself with the window manager once it is mounted,
+        # so creating windows that are never mounted doesn't touch the manager at all.
+        self._needs_registration = True
 
-        self.manager.register_window(self)  # Register this window to the window manager.
+        self._parent_widget: Widget | None = None  # Set on mount, used by clamp_into_parent_area()
+        # Parent size, window size and offset after the last clamp. Nothing to do if none changed.
+        self._last_clamp: tuple[Size, Size, Offset] | None = None
 
     #! OVERRIDE
     async def _compose(self) -> None:
 
         # This is the fancy layer system. Its what allows the window to be windowy.
         # Using the _current_layer class variable, we can keep track of the next available layer.
-        current_layers = self.screen.layers
-        if f"window{self.layer_index}" not in current_layers:
-            layers = [layer for layer in current_layers if not layer.startswith("_")]
-            # '_' denotes textual built-in layers. We want to skip those. Textual handles them
-            # behind the scenes, and we don't want to mess with them.
-            layers.extend([f"window{self.layer_index}"])  # add our new layer onto the non-built ins
-            self.screen.styles.layers = tuple(layers)  # type: ignore
-        self.styles.layer = f"window{self.layer_index}"
+        layer = self._layer_name
+        # The screen's styles only hold the non-built-in layers (Textual adds its own
+        # '_' layers behind the scenes), so the new layer can simply be appended.
+        # If no layers were set yet, Textual falls back to a single "default" layer.
+        current_layers = self.screen.styles.layers or ("default",)
+        if layer not in current_layers:  # Already there if the window is composed again.
+            self.screen.styles.layers = (*current_layers, layer)  # type: ignore
+        self.styles.layer = layer
         #! type ignore from: (Tuple size mismatch; expected 1 but received indeterminate)
 
-        await self.mount_all(self._window_base_widgets)  # Mount the top bar, content pane, and bottom bar.
+        # Build and mount the top bar, content pane, and bottom bar.
+        self._top_bar = TopBar(window=self, window_title=self._window_title, options=self.menu_options)
+        self._bottom_bar = BottomBar(window=self)
+        await self.mount(self._top_bar, self._content_pane, self._bottom_bar)
 
         #! ^^^ Everything above this comment is a new addition. ^^^
 
         try:
-            widgets = [*self._pending_children, *compose(self)]
+            # compose() already returns a new list, so only copy when there are pending children.
+            composed = compose(self)
+            widgets = [*self._pending_children, *composed] if self._pending_children else composed
             self._pending_children.clear()
         except TypeError as error:
             raise TypeError(f"{self!r} compose() method returned an invalid result; {error}") from error
@@ -366,6 +402,13 @@ class Window(Widget):
     def _on_mount(self, event: events.Mount) -> None:
         super()._on_mount(event)
 
+        if self._needs_registration:
+            self.manager.register_window(self)  # Register this window to the window manager.
+            self._needs_registration = False
+
+        assert isinstance(self.parent, Widget)
+        self._parent_widget = self.parent
+
         if self.app._dom_ready:  # type: ignore[unused-ignore]
             self._dom_ready()
         else:
@@ -386,8 +429,8 @@ class Window(Widget):
         self.max_height = max_size.height
 
         self.offset = await self._calculate_starting_position()
-        if self.allow_resize:
-            self.query_one(Resizer).set_max_min()
+        if self._bottom_bar.resizer is not None:
+            self._bottom_bar.resizer.set_max_min()
         ready_result = await self.manager.window_ready(self)
         if ready_result:  # this means it detected there is a window bar.
             self.manager.signal_window_state(self, self.display)
@@ -399,57 +442,64 @@ class Window(Widget):
         assert self.parent.size.width is not None
         assert self.parent.size.height is not None
 
-        if self.styles.min_width and self.styles.min_width.cells:
-            min_width = self.styles.min_width.cells
+        styles = self.styles  # Each style is only read once below.
+        parent_size = self.parent.size
+
+        min_width_scalar = styles.min_width
+        if min_width_scalar and min_width_scalar.cells:
+            min_width = min_width_scalar.cells
         else:
             # Minimum width must be set to an integer. This one can't be magicked away.
             # Allowing relative values for a minimum is just not practical.
             raise ValueError(f"Minimum width must be set to an integer value on {self.id}")
 
-        if self.styles.min_height and self.styles.min_height.cells:
-            min_height = self.styles.min_height.cells
+        min_height_scalar = styles.min_height
+        if min_height_scalar and min_height_scalar.cells:
+            min_height = min_height_scalar.cells
         else:
             raise ValueError(f"Minimum height must be set to an integer value on {self.id}")
 
         # MAX #
-        if self.styles.max_width and self.styles.max_width.cells:
-            max_width = self.styles.max_width.cells
+        max_width_scalar = styles.max_width
+        if max_width_scalar and max_width_scalar.cells:
+            max_width = max_width_scalar.cells
         else:
             # The max is actually None by default (unlike minimum which must be set).
             # So if the max is not set, it will default to the parent size.
-            max_width = self.parent.size.width
+            max_width = parent_size.width
 
-        if self.styles.max_height and self.styles.max_height.cells:
-            max_height = self.styles.max_height.cells
+        max_height_scalar = styles.max_height
+        if max_height_scalar and max_height_scalar.cells:
+            max_height = max_height_scalar.cells
         else:
-            max_height = self.parent.size.height
+            max_height = parent_size.height
 
         # NOTE: We will always have a max width and max height, and so we will also
         # by extension always have a width and height.
-        width = self.styles.width.cells if self.styles.width and self.styles.width.cells else max_width
-        height = self.styles.height.cells if self.styles.height and self.styles.height.cells else max_height
+        width_scalar = styles.width
+        height_scalar = styles.height
+        width = width_scalar.cells if width_scalar and width_scalar.cells else max_width
+        height = height_scalar.cells if height_scalar and height_scalar.cells else max_height
 
         if self.styles_dict:
             # Any of these which are not None will override any styles
             # set through other methods such as CSS.
-            min_width_style = self.styles_dict.get("min_width", None)
-            if min_width_style is not None:
-                min_width = min_width_style
-            min_height_style = self.styles_dict.get("min_height", None)
-            if min_height_style is not None:
-                min_height = min_height_style
-            max_width_style = self.styles_dict.get("max_width", None)
-            if max_width_style is not None:
-                max_width = max_width_style
-            max_height_style = self.styles_dict.get("max_height", None)
-            if max_height_style is not None:
-                max_height = max_height_style
-            width_style = self.styles_dict.get("width", None)
-            if width_style is not None:
-                width = width_style
-            height_style = self.styles_dict.get("height", None)
-            if height_style is not None:
-                height = height_style
+            styles_dict = cast("dict[str, int | None]", self.styles_dict)
+            values: dict[str, int] = {
+                "min_width": min_width,
+                "min_height": min_height,
+                "max_width": max_width,
+                "max_height": max_height,
+                "width": width,
+                "height": height,
+            }
+            for key in _WINDOW_STYLE_KEYS:
+                style = styles_dict.get(key)
+                if style is not None:
+                    values[key] = style
+            min_width, min_height, max_width, max_height, width, height = (
+                values[key] for key in _WINDOW_STYLE_KEYS
+            )
 
         # Clamp to the set min and maxes (just in case the size set is not within those bounds).
         clamped_width = clamp(width, min_width, max_width)
@@ -468,36 +518,40 @@ class Window(Widget):
         assert self.starting_height
         assert isinstance(self.parent, Widget)
 
+        # The result only depends on these, so it is cached until one of them changes.
+        cache_key = (
+            self.parent.size,
+            self.starting_width,
+            self.starting_height,
+            self.starting_horizontal,
+            self.starting_vertical,
+        )
+        if self._start_pos_cache is not None and self._start_pos_cache[0] == cache_key:
+            starting_offset = self._start_pos_cache[1]
+        else:
+            starting_offset = self._compute_starting_position(self.parent.size)
+            self._start_pos_cache = (cache_key, starting_offset)
+
+        if not self.initialized:
+            self.initialized = True
+            self.post_message(self.Initialized(self))
+        return starting_offset
+
+    def _compute_starting_position(self, parent_size: Size) -> Offset:
+
+        assert self.starting_width
+        assert self.starting_height
+
         size = Size(self.starting_width, self.starting_height)
-        x, y = self.parent.size - size
+        x, y = parent_size - size
 
         # Parent size minus the window size will be equal to
         # how far it can move left/right(x) or up/down(y) before
         # hitting the edge of the parent.
 
-        starting_horizontals = {  # Example: x = 20
-            "left": 0,  # 0              = 0
-            "centerleft": x // 4,  # 20 / 4         = 5
-            "center": x // 2,  # 20 / 2         = 10
-            "centerright": x - (x // 4),  # 20 - (20 / 4)  = 15
-            "right": x,  # 20             = 20
-        }
-        starting_verticals = {
-            "top": 0,
-            "uppermiddle": y // 4,
-            "middle": y // 2,
-            "lowermiddle": y - (y // 4),
-            "bottom": y,
-        }
-
-        start_horizontal = starting_horizontals[self.starting_horizontal]
-        start_vertical = starting_verticals[self.starting_vertical]
-        starting_offset = Offset(start_horizontal, start_vertical)  # store this for resetting.
-
-        if not self.initialized:
-            self.initialized = True
-            self.post_message(self.Initialized(self))
-        return starting_offset
+        start_horizontal = _STARTING_HORIZONTALS[self.starting_horizontal](x)
+        start_vertical = _STARTING_VERTICALS[self.starting_vertical](y)
+        return Offset(start_horizontal, start_vertical)
 
     def _execute_remove(self) -> None:
         self.manager.unregister_window(self)
@@ -514,18 +568,19 @@ class Window(Widget):
                 self._execute_remove()
             else:
                 self.display = False
-                self.post_message(self.Minimized(self))
-                self.manager.signal_window_state(self, False)
+                self._post_state_change(self.Minimized(self), False)
 
         if self.display:  # only do work if its currently displayed
-            if self.animated:
+            if self.animated and self.animation_duration > 0 and self._needs_fade(0.0):
                 self.styles.animate(
                     "opacity",
                     0.0,
                     duration=self.animation_duration,
                     on_complete=close_animation_callback,
                 )
-            else:  # if not animated, invoke callback immediately:
+            else:  # if not animated (or nothing to fade), invoke callback immediately:
+                if self.animated:
+                    self.styles.opacity = 0.0  # skip the animator, but keep opacity in sync
                 close_animation_callback()
         else:  # if not displayed, check if it was a removal call:
             if remove:
@@ -535,9 +590,23 @@ class Window(Widget):
 
         self.display = True
         if self.animated:
-            self.styles.animate("opacity", 1.0, duration=self.animation_duration)
-        self.post_message(self.Opened(self))
-        self.manager.signal_window_state(self, True)
+            if self.animation_duration <= 0:  # zero duration, no need to go through the animator.
+                self.styles.opacity = 1.0
+            elif self._needs_fade(1.0):
+                self.styles.animate("opacity", 1.0, duration=self.animation_duration)
+        self._post_state_change(self.Opened(self), True)
+
+    def _needs_fade(self, target: float) -> bool:
+        # No need to schedule a fade if the opacity is already there, unless another
+        # fade is still running (it has to be replaced so its callback doesn't fire).
+        return self.styles.opacity != target or self.app.animator.is_being_animated(self.styles, "opacity")
+
+    def _post_state_change(self, message: WindowMessage, state: bool) -> None:
+        # Every open/minimize posts its message and updates the WindowBar button together.
+        # The manager is not part of the DOM (and windows are not children of the WindowBar),
+        # so it can't pick up the message itself and needs to be told directly.
+        self.post_message(message)
+        self.manager.signal_window_state(self, state)
 
     async def _on_mouse_down(self, event: events.MouseDown) -> None:
         await super()._on_mouse_down(event)
@@ -585,19 +654,17 @@ class Window(Widget):
     # focused style when its descendants/children inside the window are focused.
     # So in other words, the window will stay highlighted even when you're actually focused
     # on the window's children/interior contents.
+    # The class is toggled on the window itself and the DEFAULT_CSS cascades it down
+    # to the top bar, bottom bar, and content pane (one class change instead of three).
     @on(events.DescendantFocus)
     def descendant_focused(self, event: events.DescendantFocus) -> None:
 
-        self.query_one(TopBar).add_class("focused")
-        self.query_one(BottomBar).add_class("focused")
-        self.query_one("#content_pane").add_class("focused")
+        self.add_class("descendant-focused")
 
     @on(events.DescendantBlur)
     def descendant_blurred(self, event: events.DescendantBlur) -> None:
 
-        self.query_one(TopBar).remove_class("focused")
-        self.query_one(BottomBar).remove_class("focused")
-        self.query_one("#content_pane").remove_class("focused")
+        self.remove_class("descendant-focused")
 
     ####################
     # ~ WATCH METHODS ~#
@@ -605,35 +672,44 @@ class Window(Widget):
 
     def watch_snap_state(self, value: bool) -> None:
 
-        if value:
+        self.manager.signal_snap_state(self, value)
+        # A closed window is clamped when it is opened again, so skip the work here.
+        if value and self.display and self.initialized:
             self.clamp_into_parent_area()
 
     def watch_open_state(self, value: bool) -> None:
 
         if value:
             self._open_animation()
+            if self.snap_state:
+                self.clamp_into_parent_area()
             if self.auto_focus:
                 self.focus()
         else:
             self._close_animation(remove=False)
-            self.query(Widget).blur()
+            # Only one widget can have focus, so there's no need to blur every child.
+            focused = self.screen.focused
+            if focused is not None and self in focused.ancestors:
+                focused.blur()
 
     def watch_maximize_state(self, value: bool) -> None:
 
         if value:
             self.saved_size = Size(self.size.width, self.size.height)
             self.saved_offset = Offset(self.offset.x, self.offset.y)
-            self.styles.width = self.max_width
-            self.styles.height = self.max_height
-            self._top_bar.maximize_button.swap_in_restore_icon()
-            self.call_after_refresh(self.clamp_into_parent_area)
+            with self.app.batch_update():
+                self.styles.width = self.max_width
+                self.styles.height = self.max_height
+                self._top_bar.maximize_button.swap_in_restore_icon()
+            self.call_after_refresh(self.clamp_into_parent_area)  # Still needs pulling into the parent.
         else:
             assert self.saved_size is not None, "This should never happen."
             assert self.saved_offset is not None, "This should never happen."
-            self.styles.width = self.saved_size.width
-            self.styles.height = self.saved_size.height
-            self.offset = self.saved_offset
-            self._top_bar.maximize_button.swap_in_maximize_icon()
+            with self.app.batch_update():
+                self.styles.width = self.saved_size.width
+                self.styles.height = self.saved_size.height
+                self.offset = self.saved_offset
+                self._top_bar.maximize_button.swap_in_maximize_icon()
 
     ###############
     # ~ Actions ~ #
@@ -694,10 +770,15 @@ class Window(Widget):
         `auto_bring_forward` is set to True on the window. If you want manual control,
         you can set that to False and call this method yourself."""
 
+        current_layers = self.screen.styles.layers
+        if current_layers and current_layers[-1] == self._layer_name:
+            return  # Already the top layer, nothing to do.
+
         # Get all layers that are not this widget's layer:
-        layers = tuple(x for x in self.screen.styles.layers if x != self.layer)
-        # Append this widget's layer to the end of the tuple:
-        self.screen.styles.layers = layers + tuple([self.styles.layer])  # type: ignore
+        layers = [x for x in current_layers if x != self._layer_name]
+        # Append this widget's layer to the end:
+        layers.append(self._layer_name)
+        self.screen.styles.layers = tuple(layers)  # type: ignore
         #! Tuple size mismatch; expected 1 but received indeterminate
 
     def maximize(self) -> None:
@@ -729,32 +810,31 @@ class Window(Widget):
         """Toggle the window snap (lock) state."""
         self.snap_state = not self.snap_state
 
-    def toggle_lock(self) -> None:
-        """Alias for toggle_snap(). Toggle the window snap (lock) state."""
-        self.snap_state = not self.snap_state
+    toggle_lock = toggle_snap
+    "Alias for toggle_snap(). Toggle the window snap (lock) state."
 
     async def reset_window(self) -> None:
         """Reset the window to its starting position and size."""
 
-        await self.reset_size()
-        await self.reset_position()
-        self.snap_state = self.starting_snap_state
-
-        if self.start_open:
-            self.open_state = True
-        else:
-            self.open_state = False
+        with self.app.batch_update():  # The whole reset lands in a single screen update.
+            await self.reset_size()
+            await self.reset_position()
+            # Reactives only run their watchers when the value actually changes,
+            # so these are no-ops if the window is already in its starting state.
+            self.snap_state = self.starting_snap_state
+            self.open_state = self.start_open
 
     async def reset_size(self) -> None:
         """Reset the window size to its starting size."""
 
         size, min_size, max_size = await self._calculate_all_sizes()
-        self.styles.width = size.width
-        self.styles.height = size.height
-        self.min_width = min_size.width
-        self.min_height = min_size.height
-        self.max_width = max_size.width
-        self.max_height = max_size.height
+        with self.app.batch_update():  # Only repaint once both dimensions are set.
+            self.styles.width = size.width
+            self.styles.height = size.height
+            self.min_width = min_size.width
+            self.min_height = min_size.height
+            self.max_width = max_size.width
+            self.max_height = max_size.height
 
     async def reset_position(self) -> None:
         """Reset the window position to its starting position."""
@@ -765,10 +845,18 @@ class Window(Widget):
         """This function returns the widget into its parent area. \n
         There shouldn't be any need to call this manually, but it is here if you need it."""
 
-        if self.initialized:
-            assert isinstance(self.parent, Widget)
-            x, y = self.parent.size - self.size
-            self.offset = Offset(clamp(self.offset.x, 0, x), clamp(self.offset.y, 0, y))
+        if self.initialized and self._parent_widget:
+            parent_size, size, offset = self._parent_widget.size, self.size, self.offset
+            if self._last_clamp == (parent_size, size, offset):
+                return  # Already clamped for this exact layout.
+            x, y = parent_size - size
+            offset_x, offset_y = offset
+            new_x = clamp(offset_x, 0, x)
+            new_y = clamp(offset_y, 0, y)
+            if new_x != offset_x or new_y != offset_y:  # Only write the offset if it moved.
+                offset = Offset(new_x, new_y)
+                self.offset = offset
+            self._last_clamp = (parent_size, size, offset)
 
     def mount_in_window(
         self,
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from textual.app import ComposeResult
 
 # Textual and rich imports
-from textual import on, work
+from textual import on
 from textual.css.query import NoMatches
 from textual.geometry import Offset
 from textual.screen import ModalScreen
@@ -38,6 +38,8 @@ __all__ = [
 ]
 
 DOCK_DIRECTION = Literal["top", "bottom"]
+_VALID_DOCKS = frozenset(("top", "bottom"))
+_INVALID_DOCKS = frozenset(("left", "right"))  # Could be set in CSS, but not supported.
 
 
 class WindowBarButton(NoSelectStatic):
@@ -47,6 +49,7 @@ class WindowBarButton(NoSelectStatic):
     def __init__(self, content: VisualType, window: Window, window_bar: WindowBar, **kwargs: Any):
         super().__init__(content=content, **kwargs)
         self.display_text = content  # store the original content for later use
+        self._minimized_text = "•" + str(content)  # shown with a dot when the window is minimized
         self.window = window
         self.window_bar = window_bar
         self.click_started_on: bool = False
@@ -59,7 +62,7 @@ class WindowBarButton(NoSelectStatic):
             self.add_class("right_pressed")
         self.click_started_on = True
 
-    async def on_mouse_up(self, event: events.MouseUp) -> None:
+    def on_mouse_up(self, event: events.MouseUp) -> None:
 
         self.remove_class("pressed")
         self.remove_class("right_pressed")
@@ -76,11 +79,10 @@ class WindowBarButton(NoSelectStatic):
         self.remove_class("right_pressed")
         self.click_started_on = False
 
-    @work
-    async def show_popup(self) -> None:
+    def show_popup(self) -> None:
 
         absolute_offset = self.screen.get_offset(self)
-        await self.app.push_screen_wait(
+        self.app.push_screen(
             WindowBarMenu(
                 menu_offset=absolute_offset,
                 dock=self.window_bar.dock,
@@ -93,7 +95,7 @@ class WindowBarButton(NoSelectStatic):
         if new_value:
             self.update(self.display_text)
         else:  # if the window is minimized, we show a dot.
-            self.update("•" + str(self.display_text))
+            self.update(self._minimized_text)
 
 
 class WindowBarAllButton(NoSelectStatic):
@@ -108,7 +110,7 @@ class WindowBarAllButton(NoSelectStatic):
         self.add_class("pressed")
         self.click_started_on = True
 
-    async def on_mouse_up(self, event: events.MouseUp) -> None:
+    def on_mouse_up(self, event: events.MouseUp) -> None:
 
         self.remove_class("pressed")
         if self.click_started_on:
@@ -120,8 +122,7 @@ class WindowBarAllButton(NoSelectStatic):
         self.remove_class("pressed")
         self.click_started_on = False
 
-    @work
-    async def show_popup(self, event: events.MouseUp) -> None:
+    def show_popup(self, event: events.MouseUp) -> None:
 
         max_size = self.window_bar.size.width - 14
         diff = event.screen_offset.x - max_size
@@ -130,7 +131,7 @@ class WindowBarAllButton(NoSelectStatic):
         else:
             menu_offset = event.screen_offset
 
-        await self.app.push_screen_wait(
+        self.app.push_screen(
             WindowBarMenu(
                 menu_offset=menu_offset,
                 dock=self.window_bar.dock,
@@ -141,7 +142,9 @@ class WindowBarAllButton(NoSelectStatic):
 
 class WindowBarMenu(ModalScreen[None]):
 
-    CSS = """
+    _TOGGLE_DOCK_LABEL = f"Toggle Dock {Emoji('arrow_up_down')}"  # Built once, not per popup.
+
+    DEFAULT_CSS = """
     WindowBarMenu {
         background: $background 0%;
         align: left top;    /* This will set the starting coordinates to (0, 0) */
@@ -174,9 +177,23 @@ class WindowBarMenu(ModalScreen[None]):
         self.window = window
         self.window_bar = window_bar
 
+        # The size and position of the menu are known up front, so they're set before
+        # the container is mounted rather than moving it around after the first layout.
+        self._menu_height = 3 if window else 7  # Same priority as in compose()
+        if dock == "top":
+            y_offset = menu_offset.y + 1  # When at the top, just shift down by 1 row.
+        elif dock == "bottom":
+            y_offset = menu_offset.y - self._menu_height
+        else:
+            raise ValueError("Dock must be either 'top' or 'bottom'")
+        self._menu_offset = Offset(menu_offset.x, y_offset)
+
     def compose(self) -> ComposeResult:
 
-        with Container(id="menu_container"):
+        menu = Container(id="menu_container")
+        menu.styles.height = self._menu_height
+        menu.styles.offset = self._menu_offset
+        with menu:
             if self.window:
                 snap_label = "Unsnap" if self.window.snap_state else "Snap"
                 yield ButtonStatic(snap_label, id="snap_unsnap")
@@ -190,25 +207,10 @@ class WindowBarMenu(ModalScreen[None]):
                 yield ButtonStatic("Unsnap all", id="unsnap_all")
                 yield ButtonStatic("Reset all", id="reset_all")
                 if self.window_bar.show_toggle_dock:
-                    yield ButtonStatic(f"Toggle Dock {Emoji('arrow_up_down')}", id="toggle_dock")
+                    yield ButtonStatic(self._TOGGLE_DOCK_LABEL, id="toggle_dock")
             else:
                 raise RuntimeError("WindowBarMenu must have either a Window or WindowBar")
 
-    def on_mount(self) -> None:
-
-        menu = self.query_one("#menu_container")
-        if self.window_bar:
-            menu.styles.height = 7  # * remember to also change below
-
-        if self.dock == "top":
-            y_offset = self.menu_offset.y + 1  # When at the top, just shift down by 1 row.
-        elif self.dock == "bottom":
-            y_offset = self.menu_offset.y - (3 if self.window else 7)
-        else:
-            raise ValueError("Dock must be either 'top' or 'bottom'")
-
-        menu.offset = Offset(self.menu_offset.x, y_offset)
-
     def on_mouse_up(self) -> None:
 
         self.dismiss(None)
@@ -218,30 +220,31 @@ class WindowBarMenu(ModalScreen[None]):
         # Normally I use the CSS selectors. But in this case, it's actually
         # cleaner to just use nested if statements. You can see why.
 
+        button_id = event.button.id
         if self.window:
-            if event.button.id == "snap_unsnap":
+            if button_id == "snap_unsnap":
                 self.window.toggle_snap()
-            elif event.button.id == "close":
+            elif button_id == "close":
                 if self.window.window_mode == "temporary":
                     self.window.remove_window()
                 else:
                     self.window.minimize()
-            elif event.button.id == "reset":
+            elif button_id == "reset":
                 await self.window.reset_window()
         elif self.window_bar:
-            if event.button.id == "open_all":
+            if button_id == "open_all":
                 self.window_bar.manager.open_all_windows()
-            elif event.button.id == "close_all":
+            elif button_id == "close_all":
                 self.window_bar.manager.close_all_windows()
-            elif event.button.id == "minimize_all":
+            elif button_id == "minimize_all":
                 self.window_bar.manager.minimize_all_windows()
-            elif event.button.id == "snap_all":
+            elif button_id == "snap_all":
                 self.window_bar.manager.snap_all_windows()
-            elif event.button.id == "unsnap_all":
+            elif button_id == "unsnap_all":
                 self.window_bar.manager.unsnap_all_windows()
-            elif event.button.id == "reset_all":
+            elif button_id == "reset_all":
                 await self.window_bar.manager.reset_all_windows()
-            elif event.button.id == "toggle_dock":
+            elif button_id == "toggle_dock":
                 self.window_bar.toggle_dock_location()
 
 
@@ -269,12 +272,13 @@ class WindowBar(Horizontal):
     class DockToggled(Message):
         """Message sent when the dock location is toggled."""
 
+        __slots__ = ("dock",)
+
         def __init__(self, dock: str) -> None:
             super().__init__()
             self.dock = dock
 
     manager = window_manager
-    unnamed_window_counter: int = 1
 
     dock: reactive[str] = reactive[str]("bottom", always_update=True)
     """The direction to dock the bar. Can be either 'top' or 'bottom'.  
@@ -304,13 +308,19 @@ class WindowBar(Horizontal):
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
 
-        if dock not in ["top", "bottom"]:
+        if dock not in _VALID_DOCKS:
             raise ValueError("Dock must be either 'top' or 'bottom'")
 
         self.start_open = start_open
         self.display = start_open
         self.show_toggle_dock = show_toggle_dock
         self.initialized = False
+        self._clamp_pending = False  # If a clamp of the snapped windows is already scheduled.
+        self._right_anchor = WindowBarAllButton(window_bar=self, id="windowbar_button_right")
+        self._buttons: dict[str, WindowBarButton] = {}  # Window buttons by window ID.
+        self._pending_buttons: list[WindowBarButton] = []  # Waiting to be mounted together.
+        self._app_has_header = False  # These two are set by check_header_footer()
+        self._app_has_footer = False
         self.set_reactive(WindowBar.dock, dock)  # triggering the reactive this early would not work.
 
         self.manager.register_windowbar(self)
@@ -318,16 +328,18 @@ class WindowBar(Horizontal):
     def compose(self) -> ComposeResult:
 
         yield WindowBarAllButton(window_bar=self, id="windowbar_button_left")
-        yield WindowBarAllButton(window_bar=self, id="windowbar_button_right")
+        yield self._right_anchor  # Window buttons are mounted before this one.
 
     #! OVERRIDE
     def _on_mount(self, event: events.Mount) -> None:
         super()._on_mount(event)
 
-        if self.styles.dock in ["left", "right"]:
+        self.check_header_footer()  # Must be known before the dock is set below.
+
+        if self.styles.dock in _INVALID_DOCKS:
             raise ValueError("Dock must be either 'top' or 'bottom'")
 
-        elif self.styles.dock in ["top", "bottom"]:
+        elif self.styles.dock in _VALID_DOCKS:
             self.log(f"Detected dock in CSS: {self.styles.dock}")
             self.dock = self.styles.dock
 
@@ -343,79 +355,84 @@ class WindowBar(Horizontal):
 
         #! This should be more explicitly part of the API.
 
-        if self.initialized:
+        if self.initialized and not self._clamp_pending:
             self.log.debug("Resizing WindowBar")
-            windows = self.manager.get_windows_as_list()
-            for window in windows:
-                if window.initialized and window.snap_state:
-                    self.call_after_refresh(window.clamp_into_parent_area)
+            # Resize events can come in quick succession. Only one clamp of all the windows
+            # is scheduled at a time, and it runs after the refresh so the new sizes are known.
+            self._clamp_pending = True
+            self.call_after_refresh(self._clamp_snapped_windows)
+
+    def _clamp_snapped_windows(self) -> None:
+
+        self._clamp_pending = False
+        for window in self.manager.snapped_windows:
+            if window.initialized:
+                window.clamp_into_parent_area()
 
     def watch_dock(self, new_value: str) -> None:
 
-        if new_value not in ["top", "bottom"]:
+        if new_value not in _VALID_DOCKS:
             raise ValueError("Dock must be either 'top' or 'bottom'")
 
-        try:
-            self.app.query_one(Header)
-        except NoMatches:
-            app_has_header = False
-        else:
-            app_has_header = True
-        try:
-            self.app.query_one(Footer)
-        except NoMatches:
-            app_has_footer = False
-        else:
-            app_has_footer = True
-
-        if new_value == "top":
-            self.styles.dock = "top"
-            self.styles.align = ("center", "bottom")
-            if app_has_header:
-                self.styles.height = 2
-            else:
-                self.styles.height = 1
-        else:  # new_value == "bottom"
-            self.styles.dock = "bottom"
-            self.styles.align = ("center", "top")
-            if app_has_footer:
-                self.styles.height = 2
-            else:
-                self.styles.height = 1
+        with self.app.batch_update():  # dock, align and height change together.
+            if new_value == "top":
+                self.styles.dock = "top"
+                self.styles.align = ("center", "bottom")
+                if self._app_has_header:
+                    self.styles.height = 2
+                else:
+                    self.styles.height = 1
+            else:  # new_value == "bottom"
+                self.styles.dock = "bottom"
+                self.styles.align = ("center", "top")
+                if self._app_has_footer:
+                    self.styles.height = 2
+                else:
+                    self.styles.height = 1
 
         self.post_message(WindowBar.DockToggled(dock=new_value))
 
-    @work(group="windowbar")
-    async def add_window_button(self, window: Window) -> None:
+    def add_window_button(self, window: Window) -> None:
         # Called by the WindowManager when a new window is added.
         # It will create a button for the window and add it to the WindowBar.
         # There is no need to call this manually.
 
-        display_name = (window.icon + " " + window.name) if window.icon else window.name
-
-        await self.mount(
-            WindowBarButton(
-                content=display_name,
-                window=window,
-                window_bar=self,
-                id=f"{window.id}_button",
-            ),
-            before=self.query_one("#windowbar_button_right"),
+        button = WindowBarButton(
+            content=window.display_name,
+            window=window,
+            window_bar=self,
+            id=f"{window.id}_button",
         )
+        self._buttons[window.id] = button
+        # Windows usually become ready in a burst when the app starts. Their buttons
+        # are collected here and all mounted together after the next refresh.
+        if not self._pending_buttons:
+            self.call_after_refresh(self._mount_pending_buttons)
+        self._pending_buttons.append(button)
+
+    async def _mount_pending_buttons(self) -> None:
 
-    @work(group="windowbar")
-    async def remove_window_button(self, window: Window) -> None:
+        buttons, self._pending_buttons = self._pending_buttons, []
+        if buttons:
+            with self.app.batch_update():
+                await self.mount_all(buttons, before=self._right_anchor)
+
+    def remove_window_button(self, window: Window) -> None:
         # Called by the WindowManager when a window is removed.
         # It will remove the button for the window from the WindowBar.
         # There is no need to call this manually.
 
-        self.query_one(f"#{window.id}_button").remove()
+        button = self._buttons.pop(window.id)
+        if button in self._pending_buttons:  # Removed before it was ever mounted.
+            self._pending_buttons.remove(button)
+        else:
+            button.remove()
 
     def update_window_button_state(self, window: Window, state: bool) -> None:
         # called by the WindowManager when a window is minimized or opened.
         # There is no need to call this manually.
 
-        button = self.query_one(f"#{window.id}_button", WindowBarButton)
+        button = self._buttons[window.id]
         if state:
             button.window_state = True
         else:  # window was minimized:
@@ -425,6 +442,25 @@ class WindowBar(Horizontal):
     # ~ Public API ~ #
     ##################
 
+    def check_header_footer(self) -> None:
+        """Check whether the app has a Header and/or Footer. The bar is made taller when
+        docked on the same side as one of them. This is done automatically when the bar
+        is mounted. If you add or remove a Header or Footer afterwards, call this
+        (and then `set_dock_location`) to update the bar."""
+
+        try:
+            self.app.query_one(Header)
+        except NoMatches:
+            self._app_has_header = False
+        else:
+            self._app_has_header = True
+        try:
+            self.app.query_one(Footer)
+        except NoMatches:
+            self._app_has_footer = False
+        else:
+            self._app_has_footer = True
+
     def set_dock_location(self, dock: DOCK_DIRECTION = "bottom") -> None:
         """Set the direction to dock the bar. Can be either 'top' or 'bottom'."""
         self.dock = dock
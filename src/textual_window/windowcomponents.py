@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
+    from textual.timer import Timer
     from textual.visual import VisualType
     from textual.app import ComposeResult
     from textual_window.window import Window
@@ -16,11 +17,11 @@ if TYPE_CHECKING:
 # Textual and Rich imports
 import textual.events as events
 from textual.widget import Widget
-from textual import on, work
+from textual import on
 from textual.geometry import clamp
 from textual.containers import Horizontal, Container
 from textual.screen import ModalScreen
-from textual.geometry import Offset
+from textual.geometry import Offset, Size
 
 # Local imports
 from textual_window.button_bases import ButtonStatic, NoSelectStatic
@@ -35,10 +36,13 @@ BUTTON_SYMBOLS: dict[str, str] = {
     "resizer": "◢",
 }
 
+# Resizing and dragging apply the latest mouse position at most once per frame (60 fps).
+_FRAME_INTERVAL = 1 / 60
+
 
 class HamburgerMenu(ModalScreen[None]):
 
-    CSS = """
+    DEFAULT_CSS = """
     HamburgerMenu {
         background: $background 0%;
         align: left top;    /* This will set the starting coordinates to (0, 0) */
@@ -92,7 +96,9 @@ class HamburgerMenu(ModalScreen[None]):
             self.call_after_refresh(self.options[event.button.name])
 
 
-class CloseButton(NoSelectStatic):
+class WindowButton(NoSelectStatic):
+    """Base class for the clickable buttons on the window's top bar.
+    Subclasses override `activate` to do something when clicked."""
 
     def __init__(self, content: VisualType, window: Window, **kwargs: Any):
         super().__init__(content=content, **kwargs)
@@ -102,7 +108,7 @@ class CloseButton(NoSelectStatic):
         # You might think that using self.capture_mouse() here would be simpler than
         # using a flag. But it causes issues. capture_mouse really shines when it's
         # used on buttons that need to move around the screen. (And it is used for that
-        # purpose below). But for this button and several others, they will never be moving
+        # purpose below). But for these buttons, they will never be moving
         # around while actively trying to click them. So using capture_mouse() causes various
         # small issues that are totally unnecessary. (inconsistent behavior, glitchiness, etc.)
 
@@ -113,11 +119,11 @@ class CloseButton(NoSelectStatic):
             self.add_class("pressed")
             self.window.focus()
 
-    def on_mouse_up(self) -> None:
+    def on_mouse_up(self, event: events.MouseUp) -> None:
 
         self.remove_class("pressed")
         if self.click_started_on:
-            self.window.close_window()
+            self.activate(event)
             self.click_started_on = False
 
     def on_leave(self) -> None:
@@ -125,8 +131,18 @@ class CloseButton(NoSelectStatic):
         self.remove_class("pressed")
         self.click_started_on = False
 
+    def activate(self, event: events.MouseUp) -> None:
+        """Called when the button is clicked (pressed and released on the button).
+        Does nothing by default."""
+
+
+class CloseButton(WindowButton):
+
+    def activate(self, event: events.MouseUp) -> None:
+        self.window.close_window()
+
 
-class HamburgerButton(NoSelectStatic):
+class HamburgerButton(WindowButton):
 
     def __init__(
         self,
@@ -135,36 +151,17 @@ class HamburgerButton(NoSelectStatic):
         options: dict[str, Callable[..., Optional[Any]]],
         **kwargs: Any,
     ):
-        super().__init__(content=content, **kwargs)
-        self.window = window
+        super().__init__(content=content, window=window, **kwargs)
         self.options = options
-        self.click_started_on: bool = False
-
-    def on_mouse_down(self, event: events.MouseDown) -> None:
-
-        if event.button == 1:  # left button
-            self.click_started_on = True
-            self.add_class("pressed")
-            self.window.focus()
-
-    async def on_mouse_up(self, event: events.MouseUp) -> None:
-
-        self.remove_class("pressed")
-        if self.click_started_on:
-            self.show_popup(event)
-            self.click_started_on = False
-
-    def on_leave(self) -> None:
 
-        self.remove_class("pressed")
-        self.click_started_on = False
+    def activate(self, event: events.MouseUp) -> None:
+        self.show_popup(event)
 
-    @work
-    async def show_popup(self, event: events.MouseUp) -> None:
+    def show_popup(self, event: events.MouseUp) -> None:
 
         menu_offset = event.screen_offset
 
-        await self.app.push_screen_wait(
+        self.app.push_screen(
             HamburgerMenu(
                 menu_offset=menu_offset,
                 window=self.window,
@@ -173,32 +170,14 @@ class HamburgerButton(NoSelectStatic):
         )
 
 
-class MaximizeButton(NoSelectStatic):
+class MaximizeButton(WindowButton):
 
     def __init__(self, content: VisualType, window: Window, **kwargs: Any):
-        super().__init__(content=content, **kwargs)
-        self.window = window
-        self.click_started_on: bool = False
+        super().__init__(content=content, window=window, **kwargs)
         self.tooltip = "Maximize" if self.window.maximize_state is False else "Restore"
 
-    def on_mouse_down(self, event: events.MouseDown) -> None:
-
-        if event.button == 1:  # left button
-            self.click_started_on = True
-            self.add_class("pressed")
-            self.window.focus()
-
-    def on_mouse_up(self) -> None:
-
-        self.remove_class("pressed")
-        if self.click_started_on:
-            self.window.toggle_maximize()
-            self.click_started_on = False
-
-    def on_leave(self) -> None:
-
-        self.remove_class("pressed")
-        self.click_started_on = False
+    def activate(self, event: events.MouseUp) -> None:
+        self.window.toggle_maximize()
 
     def swap_in_restore_icon(self) -> None:
 
@@ -211,39 +190,63 @@ class MaximizeButton(NoSelectStatic):
         self.tooltip = "Maximize"
 
 
-class MinimizeButton(NoSelectStatic):
+class MinimizeButton(WindowButton):
 
     def __init__(self, content: VisualType, window: Window, **kwargs: Any):
-        super().__init__(content=content, **kwargs)
-        self.window = window
-        self.click_started_on: bool = False
+        super().__init__(content=content, window=window, **kwargs)
         self.tooltip = "Minimize"
 
-    def on_mouse_down(self, event: events.MouseDown) -> None:
+    def activate(self, event: events.MouseUp) -> None:
+        self.window.minimize()
 
-        if event.button == 1:  # left button
-            self.click_started_on = True
-            self.add_class("pressed")
-            self.window.focus()
 
-    def on_mouse_up(self) -> None:
+class DragHandle(NoSelectStatic):
+    """Base class for the parts of the window that are dragged with the mouse
+    (the resizer and the title bar). Mouse move events can arrive much faster than
+    the screen is redrawn, so subclasses collect them and `_apply_pending` applies
+    the result at most once per frame while dragging."""
 
-        self.remove_class("pressed")
-        if self.click_started_on:
-            self.window.minimize()
-            self.click_started_on = False
+    def __init__(self, content: VisualType, window: Window, **kwargs: Any) -> None:
+        super().__init__(content=content, **kwargs)
+        self.window = window
+        self._frame_timer: Timer | None = None  # Runs _apply_pending every frame while dragging.
 
-    def on_leave(self) -> None:
+    def _start_drag(self) -> None:
+
+        self.add_class("pressed")
+        self.capture_mouse()
+        self.window.focus()
+        if self._frame_timer is None:
+            self._frame_timer = self.set_interval(_FRAME_INTERVAL, self._apply_pending)
+
+    def _end_drag(self) -> None:
+
+        if self._frame_timer is not None:
+            self._frame_timer.stop()
+            self._frame_timer = None
+        self._apply_pending()  # Make sure the final movement is applied.
 
         self.remove_class("pressed")
-        self.click_started_on = False
+        self.release_mouse()
 
+    def _apply_pending(self) -> None:
+        """Apply the mouse movement collected since the last frame.
+        Does nothing by default."""
 
-class Resizer(NoSelectStatic):
+
+class Resizer(DragHandle):
 
     def __init__(self, content: VisualType, window: Window, **kwargs: Any) -> None:
-        super().__init__(content=content, **kwargs)
-        self.window = window
+        super().__init__(content=content, window=window, **kwargs)
+        self._pending_offset: Offset | None = None  # Latest mouse position not yet applied.
+        # Parent size and window limits when set_max_min last ran.
+        self._cached_limits: tuple[Size, int, int, int | None, int | None] | None = None
+
+    def _current_limits(self) -> tuple[Size, int, int, int | None, int | None]:
+
+        window = self.window
+        assert isinstance(window.parent, Widget)
+        return (window.parent.size, window.min_width, window.min_height, window.max_width, window.max_height)
 
     def set_max_min(self) -> None:
 
@@ -258,80 +261,102 @@ class Resizer(NoSelectStatic):
         except AttributeError as e:
             self.log.error(f"{self.window.id} does not have min/max width/height set. ")
             raise e
+        self._cached_limits = self._current_limits()
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
 
         # App.mouse_captured refers to the widget that is currently capturing mouse events.
         if self.app.mouse_captured == self:
+            if event.button != 1:
+                # The left button was released somewhere we never got the mouse up
+                # (e.g. outside the terminal window), so end the resize here.
+                self.on_mouse_up()
+                return
+            self._pending_offset = event.screen_offset  # Applied on the next frame.
 
-            assert isinstance(self.window.parent, Widget)
-            assert self.window.styles.width is not None
-            assert self.window.styles.height is not None
+    def _apply_pending(self) -> None:
 
-            total_delta = event.screen_offset - self.position_on_down
-            new_size = self.size_on_down + total_delta
+        if self._pending_offset is None:
+            return
 
-            self.window.styles.width = clamp(new_size.width, self.min_width, self.max_width)
-            self.window.styles.height = clamp(new_size.height, self.min_height, self.max_height)
-
-            # * Explanation:
-            # Get the absolute position of the mouse right now (event.screen_offset),
-            # minus where it was when the mouse was pressed down (position_on_down).
-            # That gives the total delta from the original position.
-            # Note that this is not the same as the event.delta attribute,
-            # that only gives you the delta from the last mouse move event.
-            # But we need the total delta from the original position.
-            # Once we have that, add the total delta to size of the window.
-            # If total_delta is negative, the size will be smaller
+        assert isinstance(self.window.parent, Widget)
+        assert self.window.styles.width is not None
+        assert self.window.styles.height is not None
+
+        total_delta = self._pending_offset - self.position_on_down
+        new_size = self.size_on_down + total_delta
+        self._pending_offset = None
+
+        new_width = clamp(new_size.width, self.min_width, self.max_width)
+        new_height = clamp(new_size.height, self.min_height, self.max_height)
+        with self.app.batch_update():  # Width and height land in the same screen update.
+            self.window.styles.width = new_width
+            self.window.styles.height = new_height
+
+        # * Explanation:
+        # Get the absolute position of the mouse (the latest event.screen_offset),
+        # minus where it was when the mouse was pressed down (position_on_down).
+        # That gives the total delta from the original position.
+        # Note that this is not the same as the event.delta attribute,
+        # that only gives you the delta from the last mouse move event.
+        # But we need the total delta from the original position.
+        # Once we have that, add the total delta to size of the window.
+        # If total_delta is negative, the size will be smaller
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
 
         if event.button == 1:  # left button
+            if self._current_limits() != self._cached_limits:  # Parent or window limits changed.
+                self.set_max_min()
             self.position_on_down = event.screen_offset
             self.size_on_down = self.window.size
-
-            self.add_class("pressed")
-            self.capture_mouse()
-            self.window.focus()
+            self._start_drag()
 
     def on_mouse_up(self) -> None:
 
-        self.remove_class("pressed")
-        self.release_mouse()
+        self._end_drag()
         self.window.clamp_into_parent_area()  # Clamp to parent if resizing put it out of bounds
 
 
-class TitleBar(NoSelectStatic):
+class TitleBar(DragHandle):
 
     def __init__(self, window_title: str, window: Window, **kwargs: Any):
-        super().__init__(content=window_title, **kwargs)
-        self.window = window
+        super().__init__(content=window_title, window=window, **kwargs)
+        self._pending_delta = Offset()  # Mouse movement not yet applied to the window.
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
 
         if self.app.mouse_captured == self:
-            if not self.window.snap_state:  # not locked, can move freely
-                self.window.offset = self.window.offset + event.delta
-            else:  # else, if locked to parent:
-                assert isinstance(self.window.parent, Widget)
-                self.window.offset = self.window.offset + event.delta  # first move into place normally
-                self.window.clamp_into_parent_area()  # then clamp back to parent area.
+            if event.button != 1:
+                # The left button was released somewhere we never got the mouse up
+                # (e.g. outside the terminal window), so end the drag here.
+                self.on_mouse_up()
+                return
+            self._pending_delta += event.delta  # Applied on the next frame.
+
+    def _apply_pending(self) -> None:
+
+        if not self._pending_delta:
+            return
 
-                # Setting the offset and then clamping it again afterwards might not seem efficient,
-                # but it looks the best, and least glitchy. I tried doing it in a single operation, and
-                # it didn't work as well, or look as good.
+        delta = self._pending_delta
+        self._pending_delta = Offset()
+        self.window.offset = self.window.offset + delta  # first move into place normally
+        if self.window.snap_state:  # if locked to parent:
+            self.window.clamp_into_parent_area()  # then clamp back to parent area.
+
+        # Setting the offset and then clamping it again afterwards might not seem efficient,
+        # but it looks the best, and least glitchy. I tried doing it in a single operation, and
+        # it didn't work as well, or look as good.
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
 
         if event.button == 1:  # left button
-            self.add_class("pressed")
-            self.capture_mouse()
-            self.window.focus()
+            self._start_drag()
 
     def on_mouse_up(self) -> None:
 
-        self.remove_class("pressed")
-        self.release_mouse()
+        self._end_drag()
 
 
 class TopBar(Horizontal):
@@ -369,8 +394,10 @@ class BottomBar(Horizontal):
     def __init__(self, window: Window):
         super().__init__()
         self.window = window
+        self.resizer: Resizer | None = None  # Kept so the window doesn't need to query for it.
 
     def compose(self) -> ComposeResult:
         yield NoSelectStatic(id="bottom_bar_text")
         if self.window.allow_resize:
-            yield Resizer(BUTTON_SYMBOLS["resizer"], window=self.window, classes="windowbutton")
+            self.resizer = Resizer(BUTTON_SYMBOLS["resizer"], window=self.window, classes="windowbutton")
+            yield self.resizer
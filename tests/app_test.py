@@ -88,7 +88,7 @@ class WindowTestApp(App[None]):
 
             # 2) Pass a list of widgets to the constructor:
             window_widgets: list[Widget] = [Static(lorem_ipsum), Checkbox("I have read the above")]
-            yield Window(
+            self.window_1 = Window(
                 *window_widgets,
                 id="window_1",
                 starting_horizontal="right",
@@ -96,13 +96,14 @@ class WindowTestApp(App[None]):
                 start_open=True,
                 allow_maximize=True,
             )
+            yield self.window_1
 
             # 3) Custom widget with compose method:
             yield MyWindow()
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
-        self.query_one("#window_1").focus()
+        self.window_1.focus()
 
 def run_demo() -> None:
     WindowTestApp().run()
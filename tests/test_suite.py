@@ -1,10 +1,31 @@
 from pathlib import Path
+import pytest
+from textual.app import App, ComposeResult
 from textual.pilot import Pilot
+from textual.widgets import Footer, TextArea
+from textual_window import window_manager
+from textual_window import Window, WindowBar
+from textual_window.windowbar import WindowBarButton
+from textual_window.windowcomponents import TitleBar
 from textual_window.demo import WindowDemo
-# from .app_test import WindowTestApp
+from app_test import WindowTestApp
 
 DEMO_DIR = Path(__file__).parent
-TERINAL_SIZE = (110, 36)
+APP_TEST_PATH = DEMO_DIR / "app_test.py"
+TERMINAL_SIZE = (110, 36)
+
+@pytest.fixture(autouse=True)
+def clear_window_manager():
+    """The window manager is a module-level singleton and windows only unregister
+    when they're closed, so every test starts with an empty manager."""
+    window_manager._windows.clear()
+    window_manager._recent_focus_order.clear()
+    window_manager._snapped_windows.clear()
+
+async def settle(pilot: Pilot[None]) -> None:
+    """Wait until every window has finished its setup worker."""
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
 
 async def test_launch():  
     """Test launching the WindowDemo app."""
@@ -13,13 +34,154 @@ async def test_launch():
         await pilot.pause()
         await pilot.exit(None) 
 
+async def pause_once(pilot: Pilot[None]) -> None:
+    """Shared `run_before` for snapshot tests: let the app settle once."""
+    await pilot.pause()
+
 def test_snapshot_launch_only(snap_compare):
 
-    async def run_before(pilot: Pilot[None]) -> None:
+    assert snap_compare(
+        APP_TEST_PATH,
+        terminal_size=TERMINAL_SIZE,
+        run_before=pause_once,
+    )
+
+async def test_focused_child_highlights_window():
+    """Focusing a widget inside a window highlights that window like focusing the window itself."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        window_0 = app.query_one("#window_0")
+        highlight = app.window_1._top_bar.styles.background  # window_1 is focused on mount
+        assert window_0._top_bar.styles.background != highlight
+
+        app.query_one(TextArea).focus()  # inside window_0
         await pilot.pause()
+        assert window_0.has_class("descendant-focused")
+        assert window_0._top_bar.styles.background == highlight
+        assert window_0._bottom_bar.styles.background == highlight
+        assert not app.window_1.has_class("descendant-focused")
 
-    assert snap_compare(
-        DEMO_DIR / "app_test.py",
-        terminal_size=TERINAL_SIZE,
-        run_before=run_before,
-    )
\ No newline at end of file
+async def test_restore_then_maximize_in_one_frame():
+    """Restoring and maximizing again before the next layout pass leaves the window maximized."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        window = app.window_1
+        window.maximize_state = True
+        await pilot.pause()
+        maximized_size = window.size
+        assert maximized_size == (window.max_width, window.max_height)
+
+        window.maximize_state = False
+        window.maximize_state = True
+        await pilot.pause()
+        assert window.size == maximized_size
+
+async def test_registration_keeps_construction_order():
+    """Windows register on mount, but the manager still lists them in construction order."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        expected = ["window_0", "window_1", "window_2"]
+        assert list(window_manager.windows) == expected
+        # window_1 is focused on mount and moves to the front, the rest keep their order.
+        focus_order = [window.id for window in window_manager.recent_window_focus_order]
+        assert focus_order == ["window_1", "window_0", "window_2"]
+
+async def test_title_bar_drag_ends_without_mouse_up():
+    """A mouse move with the left button up ends a title bar drag that never got its mouse up."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        title_bar = app.window_1.query_one(TitleBar)
+        await pilot.mouse_down(title_bar)
+        assert app.mouse_captured is title_bar
+        assert title_bar._frame_timer is not None
+
+        await pilot.hover(title_bar, offset=(2, 0))  # Sends a move with no button held.
+        assert app.mouse_captured is None
+        assert title_bar._frame_timer is None
+        assert not title_bar.has_class("pressed")
+
+async def test_resizer_picks_up_changed_limits():
+    """Changing a window's size limits takes effect on the next resize, even if the parent didn't resize."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        window = app.query_one("#window_2")
+        resizer = window._bottom_bar.resizer
+        window.min_width = resizer.min_width + 5
+        window.max_height = resizer.max_height - 5
+
+        await pilot.mouse_down(resizer)
+        assert resizer.min_width == window.min_width
+        assert resizer.max_height == window.max_height
+        await pilot.mouse_up(resizer)
+
+async def test_window_bar_batches_new_buttons():
+    """Buttons added in the same frame are mounted together, skipping any removed before the refresh."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        window_bar = app.query_one(WindowBar)
+        initial_ids = [button.id for button in window_bar.query(WindowBarButton)]
+        assert sorted(initial_ids) == ["window_0_button", "window_1_button", "window_2_button"]
+
+        extra_windows = [Window(id=f"extra_{i}") for i in range(3)]
+        for window in extra_windows:
+            window_bar.add_window_button(window)
+        window_bar.remove_window_button(extra_windows[1])
+        assert not window_bar.query("#extra_0_button")  # Not mounted until after the refresh.
+
+        await pilot.pause()
+        button_ids = [button.id for button in window_bar.query(WindowBarButton)]
+        assert button_ids == initial_ids + ["extra_0_button", "extra_2_button"]
+
+class FooterApp(App[None]):
+
+    def compose(self) -> ComposeResult:
+        yield WindowBar(start_open=True)
+        yield Footer()
+
+async def test_window_bar_height_with_footer():
+    """The bar is two lines tall when docked on the same side as the app's Footer, one line otherwise."""
+    app = FooterApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await pilot.pause()
+        window_bar = app.query_one(WindowBar)
+        assert window_bar._app_has_footer and not window_bar._app_has_header
+        assert window_bar.styles.height is not None and window_bar.styles.height.value == 2
+
+        window_bar.set_dock_location("top")
+        await pilot.pause()
+        assert window_bar.styles.height.value == 1
+
+        await app.query_one(Footer).remove()
+        window_bar.check_header_footer()
+        window_bar.set_dock_location("bottom")
+        await pilot.pause()
+        assert window_bar.styles.height.value == 1
+
+async def test_clamp_after_move_and_parent_resize():
+    """The clamp cache doesn't skip a clamp after the window moves or its parent resizes."""
+    app = WindowTestApp()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await settle(pilot)
+        window = app.query_one("#window_2")
+        parent = app.query_one("#main_container")
+
+        def assert_inside() -> None:
+            assert 0 <= window.offset.x <= parent.size.width - window.size.width
+            assert 0 <= window.offset.y <= parent.size.height - window.size.height
+
+        window.clamp_into_parent_area()
+        assert_inside()
+        window.offset = window.offset + (50, 50)
+        window.clamp_into_parent_area()
+        assert_inside()
+
+        await pilot.resize_terminal(60, 20)
+        await pilot.pause()
+        window.clamp_into_parent_area()
+        assert_inside()